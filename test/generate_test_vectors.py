@@ -5,85 +5,188 @@ These vectors are used by the Ruby SDK's cross-library tests to verify
 byte-for-byte compatibility.
 
 Uses a deterministic private key so signatures are reproducible.
+
+Usage: python3 test/generate_test_vectors.py [OUTPUT] [--compact] [--msgpack]
 """
 
+import argparse
+import functools
+import itertools
 import json
+import os
 import sys
+import types
+from typing import NamedTuple, Optional
+import msgpack
+from Crypto.Hash import keccak as _pycryptodome_keccak
 from eth_account import Account
-
-from hyperliquid.utils.signing import (
-    action_hash,
-    construct_phantom_agent,
-    float_to_int,
-    float_to_int_for_hashing,
-    float_to_usd_int,
-    float_to_wire,
-    get_timestamp_ms,
-    order_request_to_order_wire,
-    order_type_to_wire,
-    order_wires_to_order_action,
-    sign_l1_action,
-    sign_usd_transfer_action,
-    sign_spot_transfer_action,
-    sign_withdraw_from_bridge_action,
-    sign_usd_class_transfer_action,
-    sign_send_asset_action,
-    sign_agent,
-    sign_approve_builder_fee,
-    sign_token_delegate_action,
-    sign_convert_to_multi_sig_user_action,
-    sign_user_dex_abstraction_action,
-    sign_user_set_abstraction_action,
-)
-from hyperliquid.utils.constants import MAINNET_API_URL
-from hyperliquid.info import Info
+import eth_account.messages
+from eth_account._utils.encode_typed_data import encoding_and_hashing
+from eth_keys import keys
+from eth_keys.backends import get_backend
+
+from hyperliquid.utils import signing
+
+parser = argparse.ArgumentParser(description="Generate cross-library test vectors from the Python SDK.")
+parser.add_argument("output", nargs="?", default="test/fixtures/python_test_vectors.json",
+                    help="JSON fixture path (default: %(default)s)")
+parser.add_argument("--compact", action="store_true",
+                    help="write minified JSON instead of the indented form committed to the repo")
+parser.add_argument("--msgpack", action="store_true",
+                    help="also write the vectors as MessagePack next to OUTPUT, with a .msgpack extension")
+args = parser.parse_args()
+
+# ECDSA signing dominates the runtime. eth_keys uses libsecp256k1 (coincurve)
+# when it is installed and otherwise falls back to a pure-Python curve that is
+# dozens of times slower. Both produce the same RFC 6979 signatures.
+if type(get_backend()).__name__ != "CoinCurveECCBackend":
+    print("warning: coincurve is not installed; signing with the slow pure-Python "
+          "secp256k1 backend (pip3 install coincurve)", file=sys.stderr)
 
 # Deterministic key for reproducible tests
 PRIVATE_KEY = "0x0123456789012345678901234567890123456789012345678901234567890123"
-wallet = Account.from_key(PRIVATE_KEY)
+
+
+class _PreparsedKeySigner:
+    """Drop-in for the SDK's `wallet` argument that signs with a pre-parsed key.
+
+    LocalAccount.sign_message hands its raw key bytes to Account, which rebuilds
+    a PrivateKey (and re-derives the public key, a full scalar multiplication)
+    on every signature. Passing the eth_keys object lets Account skip that, while
+    the SDK's sign_inner still produces the digest and the r/s/v dict.
+    """
+
+    def __init__(self, private_key):
+        self.key = keys.PrivateKey(bytes.fromhex(private_key[2:]))
+
+    def sign_message(self, signable_message):
+        return Account.sign_message(signable_message, private_key=self.key)
+
+
+wallet = _PreparsedKeySigner(PRIVATE_KEY)
+
+# =============================================================================
+# EIP-712 HASH CACHES
+# =============================================================================
+# Every signature rebuilds its typed-data payload from scratch, but there are
+# only a handful of distinct domains (L1 + user-signed) and struct types
+# (Agent + one per user-signed primary type). Intern their hashes so that only
+# the message hash and the ECDSA sign run per case. Signing output is unchanged.
+_hash_domain = eth_account.messages.hash_domain
+_hash_type = encoding_and_hashing.hash_type
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_hash_domain(domain_items):
+    return _hash_domain(dict(domain_items))
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_hash_type(type_, types_items):
+    return _hash_type(type_, {name: [dict(f) for f in fields] for name, fields in types_items})
+
+
+def _hash_domain_interned(domain_data):
+    return _cached_hash_domain(tuple(domain_data.items()))
+
+
+def _hash_type_interned(type_, types):
+    types_items = tuple(
+        (name, tuple(tuple(f.items()) for f in fields)) for name, fields in types.items()
+    )
+    return _cached_hash_type(type_, types_items)
+
+
+eth_account.messages.hash_domain = _hash_domain_interned
+encoding_and_hashing.hash_type = _hash_type_interned
+
+# =============================================================================
+# ACTION HASH CACHE
+# =============================================================================
+# l1_sign_cases re-uses most action_hash_cases inputs (often once per network),
+# and sign_l1_action hashes its action internally. Memoize on the msgpack
+# encoding, since action dicts are unhashable, and patch the SDK module so
+# sign_l1_action resolves the cached version too.
+#
+# The encoding itself is cached per action object: the cache key above and the
+# SDK's own action_hash (on a miss) would otherwise pack the same dict twice.
+# Entries keep a reference to the action so its id() cannot be recycled.
+_action_hash = signing.action_hash
+_action_hash_cache = {}
+_pack_cache = {}
+
+
+def _pack(action):
+    entry = _pack_cache.get(id(action))
+    if entry is None:
+        entry = _pack_cache[id(action)] = (action, msgpack.packb(action))
+    return entry[1]
+
+
+def _keccak256(data):
+    # eth_utils.keccak normalises its argument and dispatches through eth_hash's
+    # backend selector on every call; action_hash always passes plain bytes.
+    return _pycryptodome_keccak.new(digest_bits=256, data=data).digest()
+
+
+def _cached_action_hash(action, vault_address, nonce, expires_after):
+    key = (_pack(action), vault_address, nonce, expires_after)
+    h = _action_hash_cache.get(key)
+    if h is None:
+        h = _action_hash_cache[key] = _action_hash(action, vault_address, nonce, expires_after)
+    return h
+
+
+signing.action_hash = _cached_action_hash
+signing.msgpack = types.SimpleNamespace(packb=_pack)
+signing.keccak = _keccak256
 
 vectors = {}
 
 # =============================================================================
 # 1. FLOAT CONVERSION TESTS
 # =============================================================================
+from hyperliquid.utils.signing import float_to_int_for_hashing, float_to_usd_int, float_to_wire
+
+
+def _conversion_vector(convert, x):
+    try:
+        return {"input": x, "output": convert(x)}
+    except Exception as e:
+        return {"input": x, "error": str(e)}
+
+
+def _conversion_vectors(convert, cases):
+    """Apply an SDK float conversion to every case, recording rejections as errors.
+
+    The SDK helpers stay the oracle here: a NumPy re-implementation would be
+    faster but would stop the vectors from catching changes in the SDK's own
+    rounding checks.
+    """
+    return [_conversion_vector(convert, x) for x in cases]
+
+
 float_to_wire_cases = [
     0, 1, 100, 1800.0, 1670.1, 0.0147, 1.23456789, 0.00000001,
     99999999.0, 0.1, 0.01, 0.001, 10.5, 100.00000001, 42.0, 1234.5678,
     0.00001234, 50.5, 200.0, 0.12345678
 ]
-vectors["float_to_wire"] = []
-for x in float_to_wire_cases:
-    try:
-        result = float_to_wire(x)
-        vectors["float_to_wire"].append({"input": x, "output": result})
-    except Exception as e:
-        vectors["float_to_wire"].append({"input": x, "error": str(e)})
+vectors["float_to_wire"] = _conversion_vectors(float_to_wire, float_to_wire_cases)
 
 float_to_int_for_hashing_cases = [
     0, 1, 100, 1800.0, 1670.1, 0.0147, 0.00000001, 99999999.0,
     42.5, 1234.5678
 ]
-vectors["float_to_int_for_hashing"] = []
-for x in float_to_int_for_hashing_cases:
-    try:
-        result = float_to_int_for_hashing(x)
-        vectors["float_to_int_for_hashing"].append({"input": x, "output": result})
-    except Exception as e:
-        vectors["float_to_int_for_hashing"].append({"input": x, "error": str(e)})
+vectors["float_to_int_for_hashing"] = _conversion_vectors(float_to_int_for_hashing, float_to_int_for_hashing_cases)
 
 float_to_usd_int_cases = [0, 1, 100, 100.0, 50.5, 200.123456, 0.000001]
-vectors["float_to_usd_int"] = []
-for x in float_to_usd_int_cases:
-    try:
-        result = float_to_usd_int(x)
-        vectors["float_to_usd_int"].append({"input": x, "output": result})
-    except Exception as e:
-        vectors["float_to_usd_int"].append({"input": x, "error": str(e)})
+vectors["float_to_usd_int"] = _conversion_vectors(float_to_usd_int, float_to_usd_int_cases)
 
 # =============================================================================
 # 2. ORDER TYPE TO WIRE
 # =============================================================================
+from hyperliquid.utils.signing import order_type_to_wire
+
 order_type_wire_cases = [
     {"limit": {"tif": "Gtc"}},
     {"limit": {"tif": "Ioc"}},
@@ -92,72 +195,72 @@ order_type_wire_cases = [
     {"trigger": {"triggerPx": 2000.0, "isMarket": True, "tpsl": "tp"}},
     {"trigger": {"triggerPx": 1500.5, "isMarket": False, "tpsl": "sl"}},
 ]
-vectors["order_type_to_wire"] = []
-for ot in order_type_wire_cases:
-    result = order_type_to_wire(ot)
-    vectors["order_type_to_wire"].append({"input": ot, "output": result})
+vectors["order_type_to_wire"] = [{"input": ot, "output": order_type_to_wire(ot)} for ot in order_type_wire_cases]
 
 # =============================================================================
 # 3. ORDER REQUEST TO ORDER WIRE
 # =============================================================================
+from hyperliquid.utils.signing import order_request_to_order_wire
 from hyperliquid.utils.types import Cloid
 
-order_wire_cases = [
+
+class _OrderWireCase(NamedTuple):
+    coin: str
+    is_buy: bool
+    sz: float
+    limit_px: float
+    order_type: dict
+    reduce_only: bool
+    asset: int
+    cloid: Optional[Cloid] = None
+
+    def order_request(self):
+        order = {"coin": self.coin, "is_buy": self.is_buy, "sz": self.sz, "limit_px": self.limit_px,
+                 "order_type": self.order_type, "reduce_only": self.reduce_only}
+        if self.cloid is not None:
+            order["cloid"] = self.cloid
+        return order
+
+
+order_wire_cases = (
     # Basic limit order
-    {
-        "order": {"coin": "ETH", "is_buy": True, "sz": 1.0, "limit_px": 1800.0,
-                  "order_type": {"limit": {"tif": "Gtc"}}, "reduce_only": False},
-        "asset": 1
-    },
+    _OrderWireCase(coin="ETH", is_buy=True, sz=1.0, limit_px=1800.0,
+                   order_type={"limit": {"tif": "Gtc"}}, reduce_only=False, asset=1),
     # Sell order with IOC
-    {
-        "order": {"coin": "BTC", "is_buy": False, "sz": 0.5, "limit_px": 45000.0,
-                  "order_type": {"limit": {"tif": "Ioc"}}, "reduce_only": True},
-        "asset": 0
-    },
+    _OrderWireCase(coin="BTC", is_buy=False, sz=0.5, limit_px=45000.0,
+                   order_type={"limit": {"tif": "Ioc"}}, reduce_only=True, asset=0),
     # With cloid
-    {
-        "order": {"coin": "ETH", "is_buy": True, "sz": 0.0147, "limit_px": 1670.1,
-                  "order_type": {"limit": {"tif": "Gtc"}}, "reduce_only": False,
-                  "cloid": Cloid.from_int(1)},
-        "asset": 4
-    },
+    _OrderWireCase(coin="ETH", is_buy=True, sz=0.0147, limit_px=1670.1,
+                   order_type={"limit": {"tif": "Gtc"}}, reduce_only=False, asset=4,
+                   cloid=Cloid.from_int(1)),
     # Trigger order
-    {
-        "order": {"coin": "SOL", "is_buy": True, "sz": 100.0, "limit_px": 100.0,
-                  "order_type": {"trigger": {"triggerPx": 103.0, "isMarket": True, "tpsl": "sl"}},
-                  "reduce_only": False},
-        "asset": 2
-    },
+    _OrderWireCase(coin="SOL", is_buy=True, sz=100.0, limit_px=100.0,
+                   order_type={"trigger": {"triggerPx": 103.0, "isMarket": True, "tpsl": "sl"}},
+                   reduce_only=False, asset=2),
     # High precision
-    {
-        "order": {"coin": "ETH", "is_buy": True, "sz": 0.12345678, "limit_px": 1234.5678,
-                  "order_type": {"limit": {"tif": "Alo"}}, "reduce_only": False},
-        "asset": 1
-    },
-]
+    _OrderWireCase(coin="ETH", is_buy=True, sz=0.12345678, limit_px=1234.5678,
+                   order_type={"limit": {"tif": "Alo"}}, reduce_only=False, asset=1),
+)
 
-vectors["order_request_to_order_wire"] = []
-for case in order_wire_cases:
-    wire = order_request_to_order_wire(case["order"], case["asset"])
-    vectors["order_request_to_order_wire"].append({
-        "asset": case["asset"],
-        "is_buy": case["order"]["is_buy"],
-        "sz": case["order"]["sz"],
-        "limit_px": case["order"]["limit_px"],
-        "order_type": case["order"]["order_type"],
-        "reduce_only": case["order"]["reduce_only"],
-        "cloid": case["order"].get("cloid", None),
-        "output": wire
-    })
-# Fix cloid serialization
-for v in vectors["order_request_to_order_wire"]:
-    if v["cloid"] is not None:
-        v["cloid"] = str(v["cloid"])
+vectors["order_request_to_order_wire"] = [
+    {
+        "asset": case.asset,
+        "is_buy": case.is_buy,
+        "sz": case.sz,
+        "limit_px": case.limit_px,
+        "order_type": case.order_type,
+        "reduce_only": case.reduce_only,
+        "cloid": str(case.cloid) if case.cloid is not None else None,
+        "output": order_request_to_order_wire(case.order_request(), case.asset),
+    }
+    for case in order_wire_cases
+]
 
 # =============================================================================
 # 4. ACTION HASH TESTS
 # =============================================================================
+from hyperliquid.utils.signing import action_hash
+
 action_hash_cases = [
     # Dummy action, no vault
     {
@@ -391,77 +494,57 @@ action_hash_cases = [
     },
 ]
 
-vectors["action_hash"] = []
-for case in action_hash_cases:
-    h = action_hash(case["action"], case["vault_address"], case["nonce"], case["expires_after"])
-    vectors["action_hash"].append({
-        "action": case["action"],
-        "vault_address": case["vault_address"],
-        "nonce": case["nonce"],
-        "expires_after": case["expires_after"],
-        "hash_hex": "0x" + h.hex()
-    })
+# Each vector is its case (action, vault_address, nonce, expires_after) plus the hash.
+vectors["action_hash"] = [
+    {**case, "hash_hex": "0x" + action_hash(case["action"], case["vault_address"],
+                                            case["nonce"], case["expires_after"]).hex()}
+    for case in action_hash_cases
+]
 
 # =============================================================================
 # 5. L1 ACTION SIGNING TESTS (full signature r, s, v)
 # =============================================================================
-l1_sign_cases = [
-    # Mainnet
-    {"action": {"type": "dummy", "num": 100000000000}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": True},
-    # Testnet
-    {"action": {"type": "dummy", "num": 100000000000}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": False},
-    # Mainnet with vault
-    {"action": {"type": "dummy", "num": 100000000000},
-     "vault": "0x1719884eb866cb12b2287399b15f7db5e7d775ea", "nonce": 0, "expires": None, "is_mainnet": True},
-    # Testnet with vault
+from hyperliquid.utils.signing import sign_l1_action
+
+# Actions signed on both networks. itertools.product emits each base twice in
+# a row (mainnet, then testnet) sharing one action dict, so the action_hash and
+# msgpack caches above hash it once and only the phantom-agent signature differs.
+l1_sign_both_networks = [
+    # Dummy
+    {"action": {"type": "dummy", "num": 100000000000}, "vault": None, "nonce": 0, "expires": None},
+    # Dummy with vault
     {"action": {"type": "dummy", "num": 100000000000},
-     "vault": "0x1719884eb866cb12b2287399b15f7db5e7d775ea", "nonce": 0, "expires": None, "is_mainnet": False},
-    # Order mainnet
-    {"action": {"type": "order", "orders": [
-        {"a": 1, "b": True, "p": "100", "s": "100", "r": False, "t": {"limit": {"tif": "Gtc"}}}
-    ], "grouping": "na"}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": True},
-    # Order testnet
+     "vault": "0x1719884eb866cb12b2287399b15f7db5e7d775ea", "nonce": 0, "expires": None},
+    # Order
     {"action": {"type": "order", "orders": [
         {"a": 1, "b": True, "p": "100", "s": "100", "r": False, "t": {"limit": {"tif": "Gtc"}}}
-    ], "grouping": "na"}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": False},
-    # Order with cloid mainnet
-    {"action": {"type": "order", "orders": [
-        {"a": 1, "b": True, "p": "100", "s": "100", "r": False, "t": {"limit": {"tif": "Gtc"}},
-         "c": "0x00000000000000000000000000000001"}
-    ], "grouping": "na"}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": True},
-    # Order with cloid testnet
+    ], "grouping": "na"}, "vault": None, "nonce": 0, "expires": None},
+    # Order with cloid
     {"action": {"type": "order", "orders": [
         {"a": 1, "b": True, "p": "100", "s": "100", "r": False, "t": {"limit": {"tif": "Gtc"}},
          "c": "0x00000000000000000000000000000001"}
-    ], "grouping": "na"}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": False},
-    # TPSL trigger mainnet
-    {"action": {"type": "order", "orders": [
-        {"a": 1, "b": True, "p": "100", "s": "100", "r": False,
-         "t": {"trigger": {"isMarket": True, "triggerPx": "103", "tpsl": "sl"}}}
-    ], "grouping": "na"}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": True},
-    # TPSL trigger testnet
+    ], "grouping": "na"}, "vault": None, "nonce": 0, "expires": None},
+    # TPSL trigger
     {"action": {"type": "order", "orders": [
         {"a": 1, "b": True, "p": "100", "s": "100", "r": False,
          "t": {"trigger": {"isMarket": True, "triggerPx": "103", "tpsl": "sl"}}}
-    ], "grouping": "na"}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": False},
-    # createSubAccount mainnet
-    {"action": {"type": "createSubAccount", "name": "example"}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": True},
-    # createSubAccount testnet
-    {"action": {"type": "createSubAccount", "name": "example"}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": False},
-    # subAccountTransfer mainnet
-    {"action": {"type": "subAccountTransfer", "subAccountUser": "0x1d9470d4b963f552e6f671a81619d395877bf409",
-                "isDeposit": True, "usd": 10}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": True},
-    # subAccountTransfer testnet
+    ], "grouping": "na"}, "vault": None, "nonce": 0, "expires": None},
+    # createSubAccount
+    {"action": {"type": "createSubAccount", "name": "example"}, "vault": None, "nonce": 0, "expires": None},
+    # subAccountTransfer
     {"action": {"type": "subAccountTransfer", "subAccountUser": "0x1d9470d4b963f552e6f671a81619d395877bf409",
-                "isDeposit": True, "usd": 10}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": False},
-    # scheduleCancel (no time) mainnet
-    {"action": {"type": "scheduleCancel"}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": True},
-    # scheduleCancel (no time) testnet
-    {"action": {"type": "scheduleCancel"}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": False},
-    # scheduleCancel (with time) mainnet
-    {"action": {"type": "scheduleCancel", "time": 123456789}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": True},
-    # scheduleCancel (with time) testnet
-    {"action": {"type": "scheduleCancel", "time": 123456789}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": False},
+                "isDeposit": True, "usd": 10}, "vault": None, "nonce": 0, "expires": None},
+    # scheduleCancel (no time)
+    {"action": {"type": "scheduleCancel"}, "vault": None, "nonce": 0, "expires": None},
+    # scheduleCancel (with time)
+    {"action": {"type": "scheduleCancel", "time": 123456789}, "vault": None, "nonce": 0, "expires": None},
+]
+
+l1_sign_cases = [
+    {**base, "is_mainnet": is_mainnet}
+    for base, is_mainnet in itertools.product(l1_sign_both_networks, (True, False))
+] + [
+    # ---- mainnet only ----
     # cancel action
     {"action": {"type": "cancel", "cancels": [{"a": 1, "o": 123}]}, "vault": None, "nonce": 0, "expires": None, "is_mainnet": True},
     # cancelByCloid action
@@ -539,107 +622,55 @@ for case in l1_sign_cases:
 # =============================================================================
 # 6. USER-SIGNED ACTION TESTS
 # =============================================================================
-user_signed_cases = []
+from hyperliquid.utils.signing import (
+    sign_agent,
+    sign_approve_builder_fee,
+    sign_convert_to_multi_sig_user_action,
+    sign_send_asset_action,
+    sign_spot_transfer_action,
+    sign_token_delegate_action,
+    sign_usd_class_transfer_action,
+    sign_usd_transfer_action,
+    sign_user_dex_abstraction_action,
+    sign_user_set_abstraction_action,
+    sign_withdraw_from_bridge_action,
+)
 
 # UsdSend
 usd_send_action = {"destination": "0x5e9ee1089755c3435139848e47e6635505d5a13a",
                     "amount": "1", "time": 1687816341423, "type": "usdSend"}
-for is_mainnet in [True, False]:
-    sig = sign_usd_transfer_action(wallet, dict(usd_send_action), is_mainnet)
-    user_signed_cases.append({
-        "primary_type": "UsdSend",
-        "action": dict(usd_send_action),
-        "is_mainnet": is_mainnet,
-        "r": sig["r"], "s": sig["s"], "v": sig["v"],
-    })
 
 # SpotSend
 spot_send_action = {"destination": "0x5e9ee1089755c3435139848e47e6635505d5a13a",
                      "amount": "50.5", "token": "USDC", "time": 1687816341423, "type": "spotSend"}
-for is_mainnet in [True, False]:
-    sig = sign_spot_transfer_action(wallet, dict(spot_send_action), is_mainnet)
-    user_signed_cases.append({
-        "primary_type": "SpotSend",
-        "action": dict(spot_send_action),
-        "is_mainnet": is_mainnet,
-        "r": sig["r"], "s": sig["s"], "v": sig["v"],
-    })
 
 # Withdraw
 withdraw_action = {"destination": "0x5e9ee1089755c3435139848e47e6635505d5a13a",
                    "amount": "1", "time": 1687816341423, "type": "withdraw3"}
-for is_mainnet in [True, False]:
-    sig = sign_withdraw_from_bridge_action(wallet, dict(withdraw_action), is_mainnet)
-    user_signed_cases.append({
-        "primary_type": "Withdraw",
-        "action": dict(withdraw_action),
-        "is_mainnet": is_mainnet,
-        "r": sig["r"], "s": sig["s"], "v": sig["v"],
-    })
 
 # UsdClassTransfer
 usd_class_action = {"amount": "200", "toPerp": True, "nonce": 1687816341423, "type": "usdClassTransfer"}
-for is_mainnet in [True, False]:
-    sig = sign_usd_class_transfer_action(wallet, dict(usd_class_action), is_mainnet)
-    user_signed_cases.append({
-        "primary_type": "UsdClassTransfer",
-        "action": dict(usd_class_action),
-        "is_mainnet": is_mainnet,
-        "r": sig["r"], "s": sig["s"], "v": sig["v"],
-    })
 
 # SendAsset
 send_asset_action = {"destination": "0x5e9ee1089755c3435139848e47e6635505d5a13a",
                      "sourceDex": "dex1", "destinationDex": "dex2",
                      "token": "USDC", "amount": "100", "fromSubAccount": "",
                      "nonce": 1687816341423, "type": "sendAsset"}
-for is_mainnet in [True, False]:
-    sig = sign_send_asset_action(wallet, dict(send_asset_action), is_mainnet)
-    user_signed_cases.append({
-        "primary_type": "SendAsset",
-        "action": dict(send_asset_action),
-        "is_mainnet": is_mainnet,
-        "r": sig["r"], "s": sig["s"], "v": sig["v"],
-    })
 
 # ApproveAgent
 approve_agent_action = {"type": "approveAgent",
                         "agentAddress": "0x5e9ee1089755c3435139848e47e6635505d5a13a",
                         "agentName": "mybot", "nonce": 1687816341423}
-for is_mainnet in [True, False]:
-    sig = sign_agent(wallet, dict(approve_agent_action), is_mainnet)
-    user_signed_cases.append({
-        "primary_type": "ApproveAgent",
-        "action": dict(approve_agent_action),
-        "is_mainnet": is_mainnet,
-        "r": sig["r"], "s": sig["s"], "v": sig["v"],
-    })
 
 # ApproveBuilderFee
 approve_builder_action = {"maxFeeRate": "0.001",
                           "builder": "0x5e9ee1089755c3435139848e47e6635505d5a13a",
                           "nonce": 1687816341423, "type": "approveBuilderFee"}
-for is_mainnet in [True, False]:
-    sig = sign_approve_builder_fee(wallet, dict(approve_builder_action), is_mainnet)
-    user_signed_cases.append({
-        "primary_type": "ApproveBuilderFee",
-        "action": dict(approve_builder_action),
-        "is_mainnet": is_mainnet,
-        "r": sig["r"], "s": sig["s"], "v": sig["v"],
-    })
 
 # TokenDelegate
 token_delegate_action = {"validator": "0x5e9ee1089755c3435139848e47e6635505d5a13a",
                          "wei": 1000000000000000000, "isUndelegate": False,
                          "nonce": 1687816341423, "type": "tokenDelegate"}
-for is_mainnet in [True, False]:
-    sig = sign_token_delegate_action(wallet, dict(token_delegate_action), is_mainnet)
-    user_signed_cases.append({
-        "primary_type": "TokenDelegate",
-        "action": dict(token_delegate_action),
-        "is_mainnet": is_mainnet,
-        "r": sig["r"], "s": sig["s"], "v": sig["v"],
-    })
 
 # ConvertToMultiSigUser
 convert_multi_sig_action = {"type": "convertToMultiSigUser",
@@ -647,64 +678,73 @@ convert_multi_sig_action = {"type": "convertToMultiSigUser",
                                                                        "0xabcdefabcdefabcdefabcdefabcdefabcdefabcd"],
                                                    "threshold": 2}),
                             "nonce": 1687816341423}
-for is_mainnet in [True, False]:
-    sig = sign_convert_to_multi_sig_user_action(wallet, dict(convert_multi_sig_action), is_mainnet)
-    user_signed_cases.append({
-        "primary_type": "ConvertToMultiSigUser",
-        "action": dict(convert_multi_sig_action),
-        "is_mainnet": is_mainnet,
-        "r": sig["r"], "s": sig["s"], "v": sig["v"],
-    })
 
 # UserDexAbstraction
 user_dex_abs_action = {"type": "userDexAbstraction",
                        "user": "0x5e9ee1089755c3435139848e47e6635505d5a13a",
                        "enabled": True, "nonce": 1687816341423}
-for is_mainnet in [True, False]:
-    sig = sign_user_dex_abstraction_action(wallet, dict(user_dex_abs_action), is_mainnet)
-    user_signed_cases.append({
-        "primary_type": "UserDexAbstraction",
-        "action": dict(user_dex_abs_action),
-        "is_mainnet": is_mainnet,
-        "r": sig["r"], "s": sig["s"], "v": sig["v"],
-    })
 
 # UserSetAbstraction
 user_set_abs_action = {"type": "userSetAbstraction",
                        "user": "0x5e9ee1089755c3435139848e47e6635505d5a13a",
                        "abstraction": "unifiedAccount", "nonce": 1687816341423}
-for is_mainnet in [True, False]:
-    sig = sign_user_set_abstraction_action(wallet, dict(user_set_abs_action), is_mainnet)
-    user_signed_cases.append({
-        "primary_type": "UserSetAbstraction",
-        "action": dict(user_set_abs_action),
-        "is_mainnet": is_mainnet,
-        "r": sig["r"], "s": sig["s"], "v": sig["v"],
-    })
+
+# All user-signed templates share the one module-level wallet. Only the signing
+# call gets a copy, because the SDK stamps signatureChainId and hyperliquidChain
+# onto the action it is given; the vector records the untouched template.
+user_signed_cases = []
+user_signed_templates = [
+    ("UsdSend", sign_usd_transfer_action, usd_send_action),
+    ("SpotSend", sign_spot_transfer_action, spot_send_action),
+    ("Withdraw", sign_withdraw_from_bridge_action, withdraw_action),
+    ("UsdClassTransfer", sign_usd_class_transfer_action, usd_class_action),
+    ("SendAsset", sign_send_asset_action, send_asset_action),
+    ("ApproveAgent", sign_agent, approve_agent_action),
+    ("ApproveBuilderFee", sign_approve_builder_fee, approve_builder_action),
+    ("TokenDelegate", sign_token_delegate_action, token_delegate_action),
+    ("ConvertToMultiSigUser", sign_convert_to_multi_sig_user_action, convert_multi_sig_action),
+    ("UserDexAbstraction", sign_user_dex_abstraction_action, user_dex_abs_action),
+    ("UserSetAbstraction", sign_user_set_abstraction_action, user_set_abs_action),
+]
+
+for primary_type, sign_fn, template in user_signed_templates:
+    for is_mainnet in [True, False]:
+        sig = sign_fn(wallet, template.copy(), is_mainnet)
+        user_signed_cases.append({
+            "primary_type": primary_type,
+            "action": template,
+            "is_mainnet": is_mainnet,
+            "r": sig["r"], "s": sig["s"], "v": sig["v"],
+        })
 
 vectors["user_signed_signatures"] = user_signed_cases
 
 # =============================================================================
 # 7. PHANTOM AGENT CONSTRUCTION
 # =============================================================================
+from hyperliquid.utils.signing import construct_phantom_agent
+
 phantom_cases = [
     {"hash_hex": "0x0fcbeda5ae3c4950a548021552a4fea2226858c4453571bf3f24ba017eac2908", "is_mainnet": True},
     {"hash_hex": "0x0fcbeda5ae3c4950a548021552a4fea2226858c4453571bf3f24ba017eac2908", "is_mainnet": False},
 ]
+# construct_phantom_agent passes the hash through untouched, so connectionId is
+# always the bytes built here.
 vectors["phantom_agent"] = []
 for case in phantom_cases:
-    h = bytes.fromhex(case["hash_hex"][2:])
-    phantom = construct_phantom_agent(h, case["is_mainnet"])
+    phantom = construct_phantom_agent(bytes.fromhex(case["hash_hex"][2:]), case["is_mainnet"])
     vectors["phantom_agent"].append({
         "hash_hex": case["hash_hex"],
         "is_mainnet": case["is_mainnet"],
         "source": phantom["source"],
-        "connectionId": "0x" + phantom["connectionId"].hex() if isinstance(phantom["connectionId"], bytes) else str(phantom["connectionId"]),
+        "connectionId": "0x" + phantom["connectionId"].hex(),
     })
 
 # =============================================================================
 # 8. ORDER WIRES TO ORDER ACTION
 # =============================================================================
+from hyperliquid.utils.signing import order_wires_to_order_action
+
 order_action_cases = [
     {
         "wires": [{"a": 1, "b": True, "p": "1800", "s": "1", "r": False, "t": {"limit": {"tif": "Gtc"}}}],
@@ -725,15 +765,10 @@ order_action_cases = [
         "grouping": "na",
     },
 ]
-vectors["order_wires_to_order_action"] = []
+# The cases already carry the vector's input keys; record the output in place.
 for case in order_action_cases:
-    action = order_wires_to_order_action(case["wires"], case["builder"], case["grouping"])
-    vectors["order_wires_to_order_action"].append({
-        "wires": case["wires"],
-        "builder": case["builder"],
-        "grouping": case["grouping"],
-        "output": action,
-    })
+    case["output"] = order_wires_to_order_action(case["wires"], case["builder"], case["grouping"])
+vectors["order_wires_to_order_action"] = order_action_cases
 
 # =============================================================================
 # 9. NAME -> ASSET (spot index mapping on a sparse universe)
@@ -743,6 +778,8 @@ for case in order_action_cases:
 # Build the SDK Info fully offline by passing meta + spot_meta and leaving
 # perp_dexs at its default (None) -- any non-None perp_dexs triggers a live
 # self.perp_dexs() network call in 0.22.0.
+from hyperliquid.info import Info
+
 NAME_TO_ASSET_PERP_META = {
     "universe": [{"name": "BTC", "szDecimals": 5}, {"name": "ETH", "szDecimals": 4}]
 }
@@ -771,31 +808,68 @@ vectors["name_to_asset"] = {
 # OUTPUT
 # =============================================================================
 
-# Summary
+
+def _json_sections(vectors, compact=False):
+    """Yield the JSON encoding of `vectors` one top-level section at a time.
+
+    Each section is encoded on its own, so the whole tree is never walked (or
+    held as one string) at once. Joined, the chunks are byte-identical to
+    json.dump(vectors, f, indent=2), or with compact=True to the same call with
+    separators=(",", ":") and no indent -- the only form for which json uses its
+    C encoder.
+
+    There is no default= hook: sections convert Cloids, hashes and other SDK
+    objects to strings where they are built, so an unconverted value fails
+    loudly here instead of landing in the fixture as its str().
+
+    This deliberately stays on the stdlib encoder. orjson and msgspec are faster
+    but format floats differently (1e-8 for 1e-08, 0.00001234 for 1.234e-05), so
+    regenerating with them would rewrite float inputs across the fixture.
+    """
+    yield "{"
+    for i, (key, value) in enumerate(vectors.items()):
+        sep = "," if i else ""
+        if compact:
+            yield sep + json.dumps(key) + ":" + json.dumps(value, separators=(",", ":"))
+        else:
+            body = json.dumps(value, indent=2).replace("\n", "\n  ")
+            yield sep + "\n  " + json.dumps(key) + ": " + body
+    yield "}" if compact else "\n}"
+
+
+# Summary: vector count per category (name_to_asset nests its vectors under "cases")
 summary = {
-    "float_to_wire": len(vectors["float_to_wire"]),
-    "float_to_int_for_hashing": len(vectors["float_to_int_for_hashing"]),
-    "float_to_usd_int": len(vectors["float_to_usd_int"]),
-    "order_type_to_wire": len(vectors["order_type_to_wire"]),
-    "order_request_to_order_wire": len(vectors["order_request_to_order_wire"]),
-    "action_hash": len(vectors["action_hash"]),
-    "l1_signatures": len(vectors["l1_signatures"]),
-    "user_signed_signatures": len(vectors["user_signed_signatures"]),
-    "phantom_agent": len(vectors["phantom_agent"]),
-    "order_wires_to_order_action": len(vectors["order_wires_to_order_action"]),
-    "name_to_asset": len(vectors["name_to_asset"]["cases"]),
+    k: len(v["cases"]) if isinstance(v, dict) else len(v)
+    for k, v in vectors.items()
+    if not k.startswith("_")
 }
 vectors["_summary"] = summary
 
-output_path = sys.argv[1] if len(sys.argv) > 1 else "test/fixtures/python_test_vectors.json"
-import os
-os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-with open(output_path, "w") as f:
-    json.dump(vectors, f, indent=2, default=str)
+output_path = args.output
+output_dir = os.path.dirname(output_path)
+if output_dir and not os.path.isdir(output_dir):
+    os.makedirs(output_dir, exist_ok=True)
+
+# A 1 MiB buffer holds the whole fixture, so the section chunks reach the OS
+# as a single write() at close instead of one per flushed 8 KiB block. Binary
+# mode skips TextIOWrapper's per-write encoding and newline translation, which
+# also keeps the fixture LF-only when regenerated on Windows.
+with open(output_path, "wb", buffering=1 << 20) as f:
+    f.writelines(chunk.encode("utf-8") for chunk in _json_sections(vectors, compact=args.compact))
+
+# Same tree in a binary encoding for consumers that prefer not to parse JSON
+# (msgpack is already a runtime dependency of both SDKs). Hashes stay "0x..."
+# strings so both files decode to identical data.
+msgpack_path = None
+if args.msgpack:
+    msgpack_path = os.path.splitext(output_path)[0] + ".msgpack"
+    with open(msgpack_path, "wb") as f:
+        f.write(msgpack.packb(vectors))
 
 total = sum(summary.values())
 print(f"Generated {total} test vectors across {len(summary)} categories:")
 for k, v in summary.items():
     print(f"  {k}: {v}")
 print(f"\nWritten to {output_path}")
+if msgpack_path:
+    print(f"Written to {msgpack_path}")